@@ -1,6 +1,8 @@
 "Main module for running tests"
 from pathlib import Path
 from typing import List, Dict, Any
+import re
+import numpy as np
 import polars as pl
 import plotly.graph_objects as go
 
@@ -19,6 +21,17 @@ from src.real_estate_toolkit.agent_based_model.simulation import (
 from src.real_estate_toolkit.analytics.exploratory import MarketAnalyzer
 from src.real_estate_toolkit.ml_models.predictor import HousePricePredictor
 
+# Lowercase/digit words joined by single underscores
+_SNAKE_RE = re.compile(r'[a-z0-9]+(?:_[a-z0-9]+)*')
+# One or more snake_case names separated by newlines
+_SNAKE_LIST_RE = re.compile(rf'{_SNAKE_RE.pattern}(?:\n{_SNAKE_RE.pattern})*')
+
+# QualityScore members indexed by their value, for vectorized lookups
+_QS_LUT = np.array(
+    [None, QualityScore.POOR, QualityScore.FAIR, QualityScore.AVERAGE, QualityScore.GOOD, QualityScore.EXCELLENT],
+    dtype=object
+)
+
 def is_valid_snake_case(string: str) -> bool:
     """
     Check if a given string is in valid snake_case.
@@ -29,22 +42,29 @@ def is_valid_snake_case(string: str) -> bool:
     - The string doesn't start or end with an underscore
     - The string doesn't contain double underscore
     """
-    if not string:
-        # If the string is empty, it's not valid snake case
-        return False
-    if not all(
-        # Check that each character is a lowercase letter, digit, or underscore
-        char.islower() or char.isdigit() or char == '_' for char in string
-    ):
-        return False
-    if string.startswith('_') or string.endswith('_'):
-        # If the string starts or ends with an underscore, it's not valid snake case
-        return False
-    if '__' in string:
-        # If the string contains double underscore, it's not valid snake case
+    # The pattern encodes all of the rules above in a single C-level scan
+    return bool(string) and _SNAKE_RE.fullmatch(string) is not None
+
+def _validate_snake_case_batch(strings: List[str]) -> bool:
+    """
+    Check that every string is in valid snake_case in one regex pass.
+
+    The strings are joined with newlines and matched as a whole against a pattern
+    of newline-separated snake_case names, applying the rules of is_valid_snake_case.
+    """
+    if not strings:
+        return True
+    joined = "\n".join(strings)
+    # A name containing a newline itself would otherwise pass as two valid names
+    if joined.count("\n") != len(strings) - 1:
         return False
-    # If all checks pass, the string is valid snake case
-    return True
+    return _SNAKE_LIST_RE.fullmatch(joined) is not None
+
+def test_bundled_data_files_load():
+    """Test that both bundled CSV files load (their numeric columns contain late "NA" markers)"""
+    loader = DataLoader(Path("src/real_estate_toolkit/data/data_files/"))
+    assert len(loader.load_data_from_csv("train.csv")) == 1460, "train.csv should load all rows"
+    assert len(loader.load_data_from_csv("test.csv")) == 1459, "test.csv should load all rows"
 
 def test_data_loading_and_cleaning():
     """Test data loading and cleaning functionality"""
@@ -52,7 +72,7 @@ def test_data_loading_and_cleaning():
     data_path = Path("src/real_estate_toolkit/data/data_files/")
     loader = DataLoader(data_path)
     required_columns = ["Id", "SalePrice", "LotArea", "YearBuilt", "BedroomAbvGr"]
-    assert loader.validate_columns("train.csv", required_columns), "Required columns missing from dataset"
+    assert loader.validate_columns(required_columns, file_name="train.csv"), "Required columns missing from dataset"
     # Load and test data format
     data = loader.load_data_from_csv()
     assert isinstance(data, list), "Data should be returned as a list"
@@ -60,12 +80,19 @@ def test_data_loading_and_cleaning():
     # Test data cleaning
     cleaner = Cleaner(data)
     cleaner.rename_with_best_practices()
-    cleaned_data = cleaner.na_to_none()
+    cleaner.na_to_none()
+    cleaned_data = cleaner.data
     # Verify cleaning results
-    assert all(is_valid_snake_case(key) for key in cleaned_data[0].keys()), "Column names should be in snake_case"
-    assert all(val is None or isinstance(val, (str, int, float)) for row in cleaned_data for val in row.values()), \
+    assert _validate_snake_case_batch(list(cleaned_data[0].keys())), "Column names should be in snake_case"
+    # Build the columnar frame once; its schema tells us every value's type without walking the cells.
+    # Polars refuses to build a column from values without a common basic supertype.
+    try:
+        cleaned_df = pl.DataFrame(cleaned_data, infer_schema_length=None)
+    except pl.exceptions.PolarsError as error:
+        raise AssertionError(f"Values should be None or basic types: {error}") from error
+    assert all(dtype in (pl.Utf8, pl.Int64, pl.Float64, pl.Boolean, pl.Null) for dtype in cleaned_df.dtypes), \
         "Values should be None or basic types"
-    return cleaned_data
+    return cleaned_data, cleaned_df
 
 def test_descriptive_statistics(cleaned_data: List[Dict[str, Any]]):
     """Test descriptive statistics functionality"""
@@ -123,21 +150,31 @@ def test_house_functionality():
     assert house.available is False, "House should be marked as unavailable after sale"
     return house
 
-def test_market_functionality(cleaned_data: List[Dict[str, Any]]):
+def test_market_functionality(cleaned_df: pl.DataFrame):
     """Test HousingMarket class implementation"""
-    houses: List[House] = []
-    for idx, data in enumerate(cleaned_data):
-        quality_score = QualityScore(max(1, min(5, int(data['overall_qual']) // 2)))
-        house = House(
+    # Extract the needed columns once instead of looking up every key of every row
+    ids = np.arange(cleaned_df.height)
+    prices = cleaned_df['sale_price'].cast(pl.Float64).to_numpy()
+    areas = cleaned_df['gr_liv_area'].cast(pl.Float64).to_numpy()
+    bedrooms = cleaned_df['bedroom_abv_gr'].cast(pl.Int64).to_numpy()
+    years_built = cleaned_df['year_built'].cast(pl.Int64).to_numpy()
+    quality_scores = _QS_LUT[np.clip(cleaned_df['overall_qual'].cast(pl.Int64).to_numpy() // 2, 1, 5)]
+    houses: List[House] = [
+        House(
             id=idx,
-            price=float(data['sale_price']),
-            area=float(data['gr_liv_area']),
-            bedrooms=int(data['bedroom_abv_gr']),
-            year_built=int(data['year_built']),
+            price=price,
+            area=area,
+            bedrooms=bedroom_count,
+            year_built=year_built,
             quality_score=quality_score,
             available=True
         )
-        houses.append(house)
+        # tolist() converts each column to native Python scalars in one call
+        for idx, price, area, bedroom_count, year_built, quality_score in zip(
+            ids.tolist(), prices.tolist(), areas.tolist(), bedrooms.tolist(),
+            years_built.tolist(), quality_scores.tolist()
+        )
+    ]
     # Create market with single house
     market = HousingMarket(houses)
     # Test house retrieval
@@ -219,10 +256,9 @@ def test_simulation(cleaned_data: List[Dict[str, Any]]):
     availability_rate = simulation.compute_houses_availability_rate()
     assert 0 <= availability_rate <= 1, "Houses availability rate should be between 0 and 1"
 
-def test_market_analyzer():
+def test_market_analyzer(train_df: pl.DataFrame):
     """Test the functionality of the MarketAnalyzer class."""
-    dataset_path = Path("files/train.csv")
-    analyzer = MarketAnalyzer(data_path=str(dataset_path))
+    analyzer = MarketAnalyzer(df=train_df)
     # Test cleaning data
     try:
         analyzer.clean_data()
@@ -260,13 +296,12 @@ def test_market_analyzer():
         print(f"Scatter plots failed: {error}")
         return
 
-def test_house_price_predictor():
+def test_house_price_predictor(train_df: pl.DataFrame):
     """Test the functionality of the HousePricePredictor class."""
-    # Paths to the datasets
-    train_data_path = Path("files/train.csv")
+    # Path to the test dataset, the training data is shared with the market analyzer
     test_data_path = Path("files/test.csv")
     # Initialize predictor
-    predictor = HousePricePredictor(train_data_path=str(train_data_path), test_data_path=str(test_data_path))
+    predictor = HousePricePredictor(train_data=train_df, test_data_path=str(test_data_path))
     # Step 1: Test data cleaning
     print("Testing data cleaning...")
     try:
@@ -309,14 +344,17 @@ def main():
     """Main function to run all tests"""
     try:
         # Run all tests sequentially
-        cleaned_data = test_data_loading_and_cleaning()
+        test_bundled_data_files_load()
+        cleaned_data, cleaned_df = test_data_loading_and_cleaning()
         test_descriptive_statistics(cleaned_data)
         test_house_functionality()
-        market = test_market_functionality(cleaned_data)
+        market = test_market_functionality(cleaned_df)
         test_consumer_functionality(market)
         test_simulation(cleaned_data)
-        test_market_analyzer()
-        test_house_price_predictor()
+        # Parse the training set once and share the frame between the analyzer and the predictor
+        train_df = pl.read_csv(Path("files/train.csv"), null_values="NA")
+        test_market_analyzer(train_df)
+        test_house_price_predictor(train_df)
         print("All tests passed successfully!")
         return 0
     except AssertionError as e:
@@ -338,19 +338,18 @@ if __name__ == "__main__":
 # test simulation with even larger dataset
 
 def test_large_population_simulation():
-    # Expanded housing market data
-    housing_market_data = [
-        {"id": i, "price": price, "area": area, "bedrooms": bedrooms, "year_built": year_built, "quality_score": quality}
-        for i, (price, area, bedrooms, year_built, quality) in enumerate(
-            zip(
-                range(150000, 500000, 10000),  # Prices from 150k to 500k
-                range(900, 3000, 50),  # Areas from 900 to 3000 sqft
-                [1, 2, 3, 4] * 50,  # Bedrooms cycling from 1 to 4
-                range(1990, 2022),  # Year built from 1990 to 2021
-                [QualityScore.EXCELLENT.value, QualityScore.GOOD.value, QualityScore.AVERAGE.value, QualityScore.FAIR.value, QualityScore.POOR.value] * 20
-            )
-        )
-    ]
+    # Expanded housing market data, stored column-wise (one array per field)
+    columns = {
+        "price": np.arange(150000, 500000, 10000),  # Prices from 150k to 500k
+        "area": np.arange(900, 3000, 50),  # Areas from 900 to 3000 sqft
+        "bedrooms": np.tile([1, 2, 3, 4], 50),  # Bedrooms cycling from 1 to 4
+        "year_built": np.arange(1990, 2022),  # Year built from 1990 to 2021
+        "quality_score": np.tile([QualityScore.EXCELLENT.value, QualityScore.GOOD.value, QualityScore.AVERAGE.value, QualityScore.FAIR.value, QualityScore.POOR.value], 20),
+    }
+    n = min(len(column) for column in columns.values())  # The shortest column bounds the number of houses
+    housing_market_data = {"id": list(range(n))}
+    # tolist() hands the simulation native Python ints in one call per column
+    housing_market_data.update({name: column[:n].tolist() for name, column in columns.items()})
 
     # Initialize simulation parameters
     simulation = Simulation(
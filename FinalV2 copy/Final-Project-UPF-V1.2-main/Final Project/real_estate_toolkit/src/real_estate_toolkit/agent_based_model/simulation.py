@@ -1,11 +1,29 @@
 from enum import Enum, auto
 from dataclasses import dataclass
 from random import gauss, randint, shuffle
-from typing import Any, List, Dict
+from typing import Any, List, Dict, Union
 from .houses import House, QualityScore
 from .house_market import HousingMarket
 from .consumers import Consumer, Segment
 
+# Plain dict lookup avoids the Enum constructor dispatch for every house.
+# Members map to themselves so, like QualityScore(x), both raw values and members are accepted.
+_QUALITY_SCORE_BY_VALUE: Dict[Union[int, QualityScore], QualityScore] = {
+    **{score.value: score for score in QualityScore},
+    **{score: score for score in QualityScore},
+}
+
+
+def _to_quality_score(value: Any) -> QualityScore:
+    """Convert a raw value or member to a QualityScore, raising ValueError like QualityScore(value)."""
+    try:
+        score = _QUALITY_SCORE_BY_VALUE.get(value)
+    except TypeError:  # Unhashable values cannot be a valid score
+        score = None
+    if score is None:
+        raise ValueError(f"{value!r} is not a valid {QualityScore.__qualname__}")
+    return score
+
 
 class CleaningMarketMechanism(Enum):
     INCOME_ORDER_DESCENDANT = auto()
@@ -29,7 +47,7 @@ class ChildrenRange:
 
 @dataclass
 class Simulation:
-    housing_market_data: List[Dict[str, Any]]
+    housing_market_data: Union[List[Dict[str, Any]], Dict[str, List[Any]]]  # Rows or columns
     consumers_number: int
     years: int
     annual_income: AnnualIncomeStatistics
@@ -47,18 +65,44 @@ class Simulation:
     def create_housing_market(self) -> HousingMarket:
         """
         Initialize the housing market with houses.
+
+        Accepts the housing market data either as a list of rows (dicts) or as
+        a dict of equally long columns keyed by the same field names.
         """
-        houses = []
-        for house_data in self.housing_market_data:
-            house = House(
-                id=house_data["id"],
-                price=house_data["price"],
-                area=house_data["area"],
-                bedrooms=house_data["bedrooms"],
-                year_built=house_data["year_built"],
-                quality_score=QualityScore(house_data["quality_score"]),
-            )
-            houses.append(house)
+        if isinstance(self.housing_market_data, dict):
+            # Columnar data: zip the columns instead of materializing a dict per house
+            columns = self.housing_market_data
+            houses = [
+                House(
+                    id=house_id,
+                    price=price,
+                    area=area,
+                    bedrooms=bedrooms,
+                    year_built=year_built,
+                    quality_score=_to_quality_score(quality_score),
+                )
+                for house_id, price, area, bedrooms, year_built, quality_score in zip(
+                    columns["id"],
+                    columns["price"],
+                    columns["area"],
+                    columns["bedrooms"],
+                    columns["year_built"],
+                    columns["quality_score"],
+                    strict=True,  # Unequal columns are malformed input, not a smaller market
+                )
+            ]
+        else:
+            houses = []
+            for house_data in self.housing_market_data:
+                house = House(
+                    id=house_data["id"],
+                    price=house_data["price"],
+                    area=house_data["area"],
+                    bedrooms=house_data["bedrooms"],
+                    year_built=house_data["year_built"],
+                    quality_score=_to_quality_score(house_data["quality_score"]),
+                )
+                houses.append(house)
         if self.verbose:
             print(f"Housing market created with {len(houses)} houses.")
         return HousingMarket(houses)
@@ -1,19 +1,23 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 import polars as pl
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
 
 class MarketAnalyzer:
-    def __init__(self, data_path: str):
+    def __init__(self, data_path: Optional[str] = None, df: Optional[pl.DataFrame] = None):
         """
-        Initialize the analyzer with data from a CSV file.
+        Initialize the analyzer with data from a CSV file or an already loaded DataFrame.
 
         Args:
-            data_path (str): Path to the Ames Housing dataset
+            data_path (Optional[str]): Path to the Ames Housing dataset
+            df (Optional[pl.DataFrame]): Already parsed dataset, used instead of reading data_path
         """
+        if data_path is None and df is None:
+            raise ValueError("Either data_path or df must be provided.")
         try:
-            self.real_estate_data = pl.read_csv(data_path, null_values="NA")
+            # A shared frame is never modified here: clean_data works on a clone
+            self.real_estate_data = df if df is not None else pl.read_csv(data_path, null_values="NA")
             self.real_estate_clean_data = None
             self.output_dir = Path("src/real_estate_toolkit/analytics/outputs/")
             self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -38,6 +38,10 @@ class Cleaner:
 
             renamed_columns[column] = unique_column
 
+        # Nothing to do if every column name is already in snake_case
+        if all(column == new_column for column, new_column in renamed_columns.items()):
+            return
+
         # Update all rows with renamed columns
         for row in self.data:
             new_row = {renamed_columns[key]: value for key, value in row.items()}
@@ -1,7 +1,18 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Union
-import csv
+from typing import Dict, List, Any, Tuple, Union
+import functools
+import os
+import polars as pl
+
+# Characters a numeric literal can start with; anything else rules the column out up front
+_NUMERIC_FIRST = frozenset("0123456789-+.")
+
+@functools.lru_cache(maxsize=4)
+def _read_csv_cached(path: str, mtime_ns: int) -> pl.DataFrame:
+    """Parse a CSV file once per path and modification time; the frame is shared by all loaders."""
+    # Scan every row for the schema: "NA" markers can first appear late in a numeric column
+    return pl.read_csv(path, infer_schema_length=None)
 
 @dataclass
 class DataLoader:
@@ -12,6 +23,16 @@ class DataLoader:
         # Ensure data_path is a Path object
         if isinstance(self.data_path, str):
             self.data_path = Path(self.data_path)
+        # Cache of CSV headers per (path, mtime_ns), so a header is only read again if the file changes
+        self._headers: Dict[Tuple[str, int], List[str]] = {}
+        # Cache of resolved absolute path strings per file name
+        self._resolved: Dict[str, str] = {}
+
+    def _resolve(self, file_name: str) -> str:
+        """Return the absolute path of a file in data_path, computing it only once per file name."""
+        if file_name not in self._resolved:
+            self._resolved[file_name] = os.path.abspath(self.data_path / file_name)
+        return self._resolved[file_name]
 
     def load_data_from_csv(self, file_name: str = "train.csv") -> List[Dict[str, Any]]:
         """
@@ -23,13 +44,15 @@ class DataLoader:
         Returns:
             List[Dict[str, Any]]: A list of dictionaries where each dictionary represents a row.
         """
-        data = []
-        file_path = self.data_path / file_name  # Combine the base path and file name
+        file_path = self._resolve(file_name)  # Combine the base path and file name
 
         try:
-            with open(file_path, mode='r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)  # Automatically maps columns to values
-                data = [row for row in reader]  # Convert reader object to a list of dictionaries
+            # Polars parses and infers numeric types in one pass; dicts are only built at the API boundary.
+            # The parsed frame is cached, re-parsing only if the file changed on disk.
+            cache_key = (file_path, os.stat(file_path).st_mtime_ns)
+            df = _read_csv_cached(*cache_key)
+            self._headers[cache_key] = df.columns
+            data = df.to_dicts()
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {file_name} does not exist at {self.data_path}.")
         except Exception as e:
@@ -48,42 +71,56 @@ class DataLoader:
         Returns:
             bool: True if all required columns are present, False otherwise.
         """
-        file_path = self.data_path / file_name  # Combine the base path and file name
+        file_path = self._resolve(file_name)  # Combine the base path and file name
 
         try:
-            with open(file_path, mode='r', newline='', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                header = next(reader)  # Extract header from the first row
-            
-            return all(col in header for col in required_columns)  # Check required columns
+            cache_key = (file_path, os.stat(file_path).st_mtime_ns)
+            if cache_key not in self._headers:
+                # Reads the column names only, no data rows
+                self._headers[cache_key] = pl.read_csv(file_path, n_rows=0).columns
+
+            return set(required_columns).issubset(self._headers[cache_key])  # Check required columns
         except FileNotFoundError:
             raise FileNotFoundError(f"The file {file_name} does not exist at {self.data_path}.")
         except Exception as e:
             raise RuntimeError(f"An error occurred while validating {file_name}: {e}")
-    
+
     def infer_and_convert_types(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Infer and convert column data types for numeric columns.
 
+        Useful for string columns that could not be inferred at load time, e.g. numeric
+        columns containing "NA" once the cleaner has replaced those markers with None.
+
+        Only columns whose values are all strings or None are considered, and each one is
+        converted all-or-nothing: if any value (stripped of surrounding whitespace) does not
+        parse, the whole column is left as-is. Empty strings in a converted column become None.
+
         Args:
             data: List of dictionaries where each dictionary represents a row.
 
         Returns:
-            List of dictionaries with numeric values converted to appropriate types.
+            The same list of dictionaries, modified in place, with numeric columns converted.
         """
-        for row in data:
-            for column, value in row.items():
-                # Skip None or empty values
-                if value is None or value == "":
-                    continue
-                try:
-                    # Convert to float if it has a decimal point, else int
-                    if "." in value:
-                        row[column] = float(value)
-                    else:
-                        row[column] = int(value)
-                except ValueError:
-                    pass  # Leave non-numeric values as-is
+        columns = dict.fromkeys(column for row in data for column in row)  # Ordered union of keys
+        for column in columns:
+            values = [row.get(column) for row in data]
+            # Mixed or already typed columns are passed through untouched
+            if not all(value is None or isinstance(value, str) for value in values):
+                continue
+            series = pl.Series(values, dtype=pl.Utf8).str.strip_chars().replace("", None)
+            first_value = series.drop_nulls().head(1).to_list()
+            if not first_value or first_value[0][0] not in _NUMERIC_FIRST:
+                # Empty or clearly non-numeric column, skip both cast attempts
+                continue
+            for dtype in (pl.Int64, pl.Float64):
+                # Non-strict casts turn unparsable values into nulls instead of raising
+                candidate = series.cast(dtype, strict=False)
+                if candidate.null_count() == series.null_count():
+                    for row, value in zip(data, candidate.to_list()):
+                        if column in row:
+                            row[column] = value
+                    break
         return data
 
 if __name__ == "__main__":
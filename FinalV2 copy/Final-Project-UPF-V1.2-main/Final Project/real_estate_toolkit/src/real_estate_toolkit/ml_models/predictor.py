@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import polars as pl
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, OneHotEncoder
@@ -16,16 +16,29 @@ from sklearn.metrics import (
 from pathlib import Path
 
 class HousePricePredictor:
-    def __init__(self, train_data_path: str, test_data_path: str):
+    def __init__(
+        self,
+        train_data_path: Optional[str] = None,
+        test_data_path: Optional[str] = None,
+        train_data: Optional[pl.DataFrame] = None,
+        test_data: Optional[pl.DataFrame] = None,
+    ):
         """
-        Initialize the predictor class with paths to the training and testing datasets.
+        Initialize the predictor class with the training and testing datasets,
+        given either as CSV paths or as already loaded DataFrames.
         
         Args:
-            train_data_path (str): Path to the training dataset CSV file.
-            test_data_path (str): Path to the testing dataset CSV file.
+            train_data_path (Optional[str]): Path to the training dataset CSV file.
+            test_data_path (Optional[str]): Path to the testing dataset CSV file.
+            train_data (Optional[pl.DataFrame]): Already parsed training dataset, used instead of train_data_path.
+            test_data (Optional[pl.DataFrame]): Already parsed testing dataset, used instead of test_data_path.
         """
-        self.train_data = pl.read_csv(train_data_path, null_values="NA")
-        self.test_data = pl.read_csv(test_data_path, null_values="NA")
+        if train_data is None and train_data_path is None:
+            raise ValueError("Either train_data_path or train_data must be provided.")
+        if test_data is None and test_data_path is None:
+            raise ValueError("Either test_data_path or test_data must be provided.")
+        self.train_data = train_data if train_data is not None else pl.read_csv(train_data_path, null_values="NA")
+        self.test_data = test_data if test_data is not None else pl.read_csv(test_data_path, null_values="NA")
 
         # Define the target column
         self.target_column = "SalePrice"